@@ -39,8 +39,9 @@ __all__ = ["client"]
 # see ../pyproject.toml
 
 # THIS ONLY sees the installed package (in site-packages)
-#   It will miss the current local copy
-#__version__ = importlib.metadata.version("astroget") # __package__ or __name__
-
-import toml
-__version__ = toml.load('pyproject.toml')['project']['version']
+#   It will miss the current local copy (not installed); fall back to a
+#   local version in that case.
+try:
+    __version__ = importlib.metadata.version(__package__ or __name__)
+except importlib.metadata.PackageNotFoundError:
+    __version__ = '0.0.0+local'
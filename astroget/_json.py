@@ -0,0 +1,23 @@
+"""JSON decoding shared by the astroget modules.
+Uses orjson when it is installed (much faster on large responses),
+otherwise the Python Standard Library json.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(content):
+    """Decode JSON CONTENT (bytes or str).
+    orjson rejects the NaN/Infinity tokens that the server emits for
+    float NaN (common in FITS headers), so fall back to json for those."""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
@@ -9,23 +9,39 @@ TODO:
 ############################################
 # Python Standard Library
 from warnings import warn
+import contextlib
+import gzip
+import json
+import math
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from urllib.parse import urlencode, urlparse
 from math import cos,sqrt,radians,isclose
 ############################################
 # External Packages
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from astropy.io import fits
+from astropy.utils.exceptions import AstropyUserWarning
 from astropy.nddata import Cutout2D
 from astropy.utils.data import download_file
 from astropy.wcs import WCS
+from astropy.wcs.utils import proj_plane_pixel_scales
 from astropy.coordinates import SkyCoord
 from astropy import units as u
 ############################################
 # Local Packages
 from astroget.Results import Found
 import astroget.exceptions as ex
+from astroget._json import loads as _json_loads
 from astroget import __version__
-import astroget.experimental as experimental
 
 '''Methods/functions still to add:
 - voimg
@@ -38,6 +54,7 @@ ALSO:
 
 MAX_CONNECT_TIMEOUT = 3.1    # seconds
 MAX_READ_TIMEOUT = 90 * 60   # seconds
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # bytes
 
 # Upload to PyPi:
 #   python3 -m build --wheel
@@ -71,14 +88,219 @@ hducornerkeys = ['CENRA1',   'CENDEC1',
                  'COR3RA1', 'COR3DEC1',
                  'COR4RA1', 'COR4DEC1']
 racornerkeys = ['CENRA1', 'COR1RA1','COR2RA1','COR3RA1', 'COR4RA1']
+deccornerkeys = ['CENDEC1', 'COR1DEC1','COR2DEC1','COR3DEC1', 'COR4DEC1']
+
+def corners_array(headers):
+    """Center and corners of many HDUs as one array.
+
+    Args:
+        headers (:obj:`list`): One dict-like header per HDU, such as
+            returned by hdu_keywords() or fits_header().
+
+    Returns:
+        Array (:obj:`numpy.ndarray`) of shape (nhdu, 5, 2) with
+        arr[i, j] = (ra, dec) in degrees. j=0 is the center, j=1..4 are
+        corners 1..4. Values missing from a header are NaN.
+    """
+    arr = np.full((len(headers), len(racornerkeys), 2), np.nan)
+    for i, hdr in enumerate(headers):
+        for j, (rakey, deckey) in enumerate(zip(racornerkeys, deccornerkeys)):
+            if rakey in hdr and deckey in hdr:
+                arr[i, j, 0] = float(hdr[rakey])
+                arr[i, j, 1] = float(hdr[deckey])
+    return arr
+
+def _angdist(ra1, dec1, ra2, dec2):
+    """Great-circle distance (haversine) in degrees; args in degrees."""
+    (ra1, dec1, ra2, dec2) = map(np.radians, (ra1, dec1, ra2, dec2))
+    hav = (np.sin((dec2 - dec1) / 2)**2
+           + np.cos(dec1) * np.cos(dec2) * np.sin((ra2 - ra1) / 2)**2)
+    return np.degrees(2 * np.arcsin(np.sqrt(np.minimum(hav, 1.0))))
+
+def _hdus_covering_np(query, corners):
+    centers = corners[:, 0, :]
+    radius = np.max(_angdist(centers[:, None, 0], centers[:, None, 1],
+                             corners[:, 1:, 0], corners[:, 1:, 1]),
+                    axis=1)  # NaN if any corner is missing
+    dist = _angdist(query[:, None, 0], query[:, None, 1],
+                    centers[None, :, 0], centers[None, :, 1])
+    dist = np.where(dist <= radius, dist, np.inf)
+    idx = np.argmin(dist, axis=1)
+    return np.where(np.isfinite(dist[np.arange(len(idx)), idx]), idx, -1)
+
+@lru_cache(maxsize=None)
+def _hdus_covering_nb():
+    """Numba kernel for hdus_covering(); None if numba is not installed.
+    Built on first use so importing this module does not import numba."""
+    try:
+        import numba
+    except ImportError:  # optional; hdus_covering() falls back to NumPy
+        return None
+
+    # No fastmath: it assumes no NaN, but missing corners are NaN.
+    @numba.njit(cache=True)
+    def _angdist_nb(ra1, dec1, ra2, dec2):
+        (ra1, dec1) = (math.radians(ra1), math.radians(dec1))
+        (ra2, dec2) = (math.radians(ra2), math.radians(dec2))
+        hav = (math.sin((dec2 - dec1) / 2)**2
+               + math.cos(dec1) * math.cos(dec2)
+               * math.sin((ra2 - ra1) / 2)**2)
+        return math.degrees(2 * math.asin(math.sqrt(min(hav, 1.0))))
+
+    @numba.njit(cache=True, parallel=True)
+    def _kernel(query, corners):
+        (nhdu, ncor) = (corners.shape[0], corners.shape[1])
+        radius = np.empty(nhdu)
+        for h in range(nhdu):
+            rad = 0.0
+            for j in range(1, ncor):
+                d = _angdist_nb(corners[h, 0, 0], corners[h, 0, 1],
+                                corners[h, j, 0], corners[h, j, 1])
+                if math.isnan(d) or d > rad:
+                    rad = d
+                if math.isnan(rad):
+                    break
+            radius[h] = rad
+        out = np.full(query.shape[0], -1, np.int64)
+        for i in numba.prange(query.shape[0]):
+            best = np.inf
+            for h in range(nhdu):
+                d = _angdist_nb(query[i, 0], query[i, 1],
+                                corners[h, 0, 0], corners[h, 0, 1])
+                if d <= radius[h] and d < best:
+                    best = d
+                    out[i] = h
+        return out
+
+    return _kernel
+
+def hdus_covering(query_radec, corners):
+    """Find the HDU that covers each of many sky positions.
+    An HDU covers a position if the position is no farther from the HDU
+    center than the farthest HDU corner is. This is a circle, so it is
+    approximate near the edges of an HDU. Uses Numba when installed.
+
+    Args:
+        query_radec (:obj:`numpy.ndarray`): (ra, dec) in degrees,
+            shape (nquery, 2).
+
+        corners (:obj:`numpy.ndarray`): As returned by corners_array().
+
+    Returns:
+        Array (:obj:`numpy.ndarray`) of nquery HDU indices into CORNERS.
+        The HDU with the nearest center is used when several cover a
+        position. -1 where no HDU covers the position.
+    """
+    query = np.ascontiguousarray(query_radec, dtype=np.float64).reshape(-1, 2)
+    corners = np.ascontiguousarray(corners, dtype=np.float64)
+    if corners.shape[0] == 0:  # no HDUs cover anything
+        return np.full(query.shape[0], -1, np.int64)
+    kernel = _hdus_covering_nb()
+    if kernel is None:
+        return _hdus_covering_np(query, corners)
+    return kernel(query, corners)
+
+FITS_BLOCK_SIZE = 2880  # bytes
+
+def _hdu_data_size(hdr):
+    """Number of bytes (padded to FITS blocks) of data following HDR."""
+    naxis = int(hdr.get('NAXIS', 0))
+    if naxis == 0:
+        return 0
+    dims = [int(hdr[f'NAXIS{i}']) for i in range(1, naxis + 1)]
+    if hdr.get('GROUPS') and dims[0] == 0:  # Random Groups
+        dims = dims[1:]
+    nbytes = (abs(int(hdr['BITPIX'])) // 8
+              * int(hdr.get('GCOUNT', 1))
+              * (int(hdr.get('PCOUNT', 0)) + int(np.prod(dims))))
+    return -(-nbytes // FITS_BLOCK_SIZE) * FITS_BLOCK_SIZE
+
+def _is_padding(fd):
+    """True if the rest of open file FD is all zero (or blank) bytes."""
+    for block in iter(lambda: fd.read(FITS_BLOCK_SIZE), b''):
+        if block.strip(b'\0 '):
+            return False
+    return True
+
+def hdu_keywords(fitsfilename, keys=hducornerkeys):
+    """Return values of a few KEYS from every HDU of a FITS file.
+    Uses the fast header parser of astropy and skips over the data
+    so only the header cards are read; cards that are not asked for
+    are never parsed.
+
+    Args:
+        fitsfilename (:obj:`str`): Local FITS file (may be gzipped).
+
+        keys (:obj:`list`, optional): Keywords to get.
+            Defaults to hducornerkeys.
+
+    Returns:
+        List (one per HDU) of dictionaries (:obj:`list`). Keywords
+        missing from an HDU are missing from its dictionary.
+    """
+    try:
+        from astropy.io.fits.header import _BasicHeader
+    except ImportError:  # private to astropy; use the slow path if gone
+        with fits.open(fitsfilename) as hdul:
+            return [{k: hdu.header[k] for k in keys if k in hdu.header}
+                    for hdu in hdul]
+
+    opener = gzip.open if str(fitsfilename).endswith('.gz') else open
+    hdrlist = list()
+    with opener(fitsfilename, 'rb') as fd:
+        while fd.peek(1):  # stop only at a clean EOF
+            if fd.peek(1)[:1] in (b'\0', b' '):  # cannot start a header
+                if not _is_padding(fd):
+                    msg = (f'Bad header of HDU {len(hdrlist)} '
+                           f'in {fitsfilename}')
+                    raise OSError(msg)
+                # fits.open() accepts this too (with the same warning)
+                warn(f'Unexpected extra padding at the end of '
+                     f'{fitsfilename}', AstropyUserWarning)
+                break
+            try:
+                _, hdr = _BasicHeader.fromfile(fd)
+            except Exception as err:  # parser raises a bare Exception
+                msg = (f'Bad or truncated header of HDU {len(hdrlist)} '
+                       f'in {fitsfilename}')
+                raise OSError(msg) from err
+            hdrlist.append({k: hdr[k] for k in keys if k in hdr})
+            nbytes = _hdu_data_size(hdr)
+            if nbytes > 0:
+                # Read last byte of data; seek alone won't notice truncation
+                fd.seek(nbytes - 1, os.SEEK_CUR)
+                if len(fd.read(1)) != 1:
+                    msg = (f'Truncated data of HDU {len(hdrlist) - 1} '
+                           f'in {fitsfilename}')
+                    raise OSError(msg)
+    return hdrlist
+
+def _error_status(res):
+    """Decoded JSON body of error response RES; None if it is not JSON
+    (e.g. an HTML page from a proxy)."""
+    if not res.headers.get('content-type', '').startswith('application/json'):
+        return None
+    try:
+        return _json_loads(res.content)
+    except ValueError:
+        return None
+
+def _save_response(res, outfile):
+    """Write body of streamed response RES to OUTFILE.
+    Copies the raw socket stream in large blocks (no per-chunk Python
+    loop); Content-Encoding (gzip) is still undone by urllib3."""
+    res.raw.decode_content = True
+    with open(outfile, 'wb') as fd:
+        shutil.copyfileobj(res.raw, fd, length=DOWNLOAD_CHUNK_SIZE)
+    return outfile
 
 def funcToMethod(func, clas):
     setattr(clas, func.__name__, func)
 
 # The inverse of this is: Objects Near Position
 # see: https://ned.ipac.caltech.edu/forms/nearposn.html
+@lru_cache(maxsize=4096)
 def get_obj_ra_dec(object_name):
-    from astropy.coordinates import SkyCoord
     obj_coord = SkyCoord.from_name(object_name)
     #! return {'name': object_name,
     #!         'ra':obj_coord.ra.degree,
@@ -89,27 +311,81 @@ def get_obj_ra_dec(object_name):
 #! def cutout(imageid, ra, dec, pwidth, pheight):
 #!     pass
 
+# WCS of one HDU; built once per (file, hdu) in a session.
+# Keyed on the file's mtime and size too, so a file rewritten in place
+# gets a new WCS.
+_WCS_CACHE_SIZE = 256
+_wcs_cache = OrderedDict()  # _wcs_cache[(path, mtime, size, hdu_idx)] = WCS
+_wcs_cache_lock = threading.Lock()
+
+def _cached_wcs(fitsfilename, hdu_idx, header):
+    st = os.stat(fitsfilename)
+    key = (str(fitsfilename), st.st_mtime_ns, st.st_size, hdu_idx)
+    with _wcs_cache_lock:
+        wcs = _wcs_cache.get(key)
+        if wcs is not None:
+            _wcs_cache.move_to_end(key)
+            return wcs
+    wcs = WCS(header)  # outside the lock; may be slow
+    with _wcs_cache_lock:
+        _wcs_cache[key] = wcs
+        if len(_wcs_cache) > _WCS_CACHE_SIZE:
+            _wcs_cache.popitem(last=False)  # least recently used
+    return wcs
+
+def _max_size_pixels(size, wcs):
+    """Largest side (pixels) of a Cutout2D SIZE: a number or pixel/angular
+    Quantity, or a (ny, nx) tuple of those."""
+    if isinstance(size, u.Quantity):
+        sizes = np.atleast_1d(size)
+    elif np.iterable(size):
+        sizes = list(size)
+    else:
+        sizes = [size]
+    # Smallest pixel scale, so the pixel size is never underestimated
+    scale = np.min(proj_plane_pixel_scales(wcs.celestial)) * u.deg
+    npix = 0
+    for side in sizes:
+        if not isinstance(side, u.Quantity):
+            npix = max(npix, float(side))
+        elif side.unit == u.pixel:
+            npix = max(npix, side.value)
+        else:
+            npix = max(npix, (side / scale).decompose().value)
+    return int(math.ceil(npix))
+
 # Display FITS in ubuntu with: fv, ds9
 # TODO: allow filename to be URI
 def cutout(fitsfilename, hdu_idx, pos, size, outfile="cutout.fits"):
     #size = 248 # pixels in a side
     (ra, dec) = pos # of center
 
-    image_data,header = fits.getdata(fitsfilename, ext=hdu_idx, header=True)
-    wcs = WCS(header)
-
     # Cutout rectangle from image_data
     position = SkyCoord(ra=ra*u.deg, dec=dec*u.deg)
-    try:
-        print(f'image_data.shape={image_data.shape} '
-              f'position={position} '
-              f'size={size} '
-              f'wcs={wcs}')
-        cutout = Cutout2D(image_data, position, size, wcs=wcs)
-        print(f'image_data.shape={image_data.shape} cutout.shape={cutout.data.shape}')
-    except Exception as err:
-        print(err)
-        return None
+    # Only read the pixels around the cutout (memmap + section) instead
+    # of loading the whole HDU.
+    with fits.open(fitsfilename, memmap=True) as hdul:
+        hdu = hdul[hdu_idx]
+        wcs = _cached_wcs(fitsfilename, hdu_idx, hdu.header)
+        try:
+            (ny, nx) = hdu.shape
+            half = _max_size_pixels(size, wcs) // 2 + 2  # with margin
+            (x, y) = (int(round(float(c)))
+                      for c in wcs.world_to_pixel(position))
+            (y0, y1) = (max(0, y - half), min(ny, max(0, y + half + 1)))
+            (x0, x1) = (max(0, x - half), min(nx, max(0, x + half + 1)))
+            image_data = hdu.section[y0:y1, x0:x1]
+            print(f'hdu.shape={hdu.shape} '
+                  f'image_data.shape={image_data.shape} '
+                  f'position={position} '
+                  f'size={size} '
+                  f'wcs={wcs}')
+            cutout = Cutout2D(image_data, position, size,
+                              wcs=wcs[y0:y1, x0:x1])
+            print(f'image_data.shape={image_data.shape} cutout.shape={cutout.data.shape}')
+        except Exception as err:
+            print(err)
+            return None
 
     # Save cutout with WCS into new image
     newhdu = fits.PrimaryHDU(cutout.data)
@@ -143,32 +419,50 @@ class CsdcClient():
 
         read_timeout (:obj:`float`, optional): Number of seconds to
             wait for server to send a response. Generally time to
-            wait for first byte. Defaults to 5400.
+            wait for first byte. find() waits longer than this for
+            queries with a large limit. Defaults to 300.
+
+        session (:obj:`requests.Session`, optional): HTTP session to
+            use for all calls to the server; lets several clients
+            share one connection pool. Defaults to a new session.
 
     Example:
         >>> client = CsdcClient()
-        >>> client
-        (astroget:0.1.0, api:6.0, https://astroarchive.noirlab.edu/api, verbose=False, connect_timeout=1.1, read_timeout=5400)
+        >>> client  # api is None until the first request to the server
+        (astroget:0.1.0, api:None, https://astroarchive.noirlab.edu/api, verbose=False, connect_timeout=1.1, read_timeout=5400)
 
     Raises:
-        Exception: Object creation compares the version from the
-            Server against the one expected by the Client. Throws an
-            error if the Client is a major version or more behind.
+        Exception: The first request to each Server URL compares the
+            version from the Server against the one expected by the
+            Client. Throws an error if the Client is a major version or
+            more behind.
 
     """
 
     KNOWN_GOOD_API_VERSION = 8.0  # @@@ Change this on Server version increment
+    _api_version_cache = dict()  # _api_version_cache[apiurl] = apiversion
+    _no_headers_batch = set()  # apiurl of servers without /headers/
 
     def __init__(self, *,
                  url=_PROD,
                  verbose=False,
                  connect_timeout=3.05,    # seconds
-                 read_timeout=5 * 60):  # seconds
+                 read_timeout=5 * 60,  # seconds
+                 session=None):
         """Create client instance.
         """
         self.rooturl = url.rstrip("/")
         self.apiurl = f'{self.rooturl}/api'
-        self.apiversion = None
+        # URL prefixes used by every call
+        self._u_version = f'{self.apiurl}/version/'
+        self._u_find = f'{self.apiurl}/adv_search/find/?'
+        self._u_vohdu = f'{self.apiurl}/sia/vohdu?'
+        self._u_retrieve = f'{self.apiurl}/retrieve/'
+        self._u_cutout = f'{self.apiurl}/cutout/'
+        self._u_header = f'{self.apiurl}/header/'
+        self._u_headers = f'{self.apiurl}/headers/?format=json'
+        # API Version is probed lazily; see _check_api_version()
+        self.apiversion = CsdcClient._api_version_cache.get(self.apiurl)
         self.verbose = verbose
         self.c_timeout = min(MAX_CONNECT_TIMEOUT,
                              float(connect_timeout))  # seconds
@@ -176,47 +470,55 @@ class CsdcClient():
                              float(read_timeout))
         self.headers = dict() # headers[hduidx] = header as json
 
+        # Reuse TCP+TLS connections across all calls to the server.
+        # A session passed in by the caller is used as-is (and not closed).
+        self._own_session = session is None
+        if session is None:
+            session = requests.Session()
+            # Only retry failed connections; a read timeout is not re-sent.
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                                  max_retries=Retry(total=3, read=0,
+                                                    backoff_factor=0.3))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            # Compress responses with every encoding urllib3 can decode
+            # here (adds "br" when brotli is installed).
+            session.headers.update(make_headers(accept_encoding=True))
+            session.headers['User-Agent'] = f'astroget/{client_version}'
+        self.session = session
+
         # require response within this num seconds
         # https://2.python-requests.org/en/master/user/advanced/#timeouts
         # (connect timeout, read timeout) in seconds
         self.timeout = (self.c_timeout, self.r_timeout)
-        #@@@ read timeout should be a function of the POST payload size
+        # (find() scales its read timeout with the size of the query;
+        #  see _dyn_timeout)
 
         if verbose:
             print(f'apiurl={self.apiurl}')
 
-        # Get API Version
-        try:
-            endpoint = f'{self.apiurl}/version/'
-            verstr = requests.get(endpoint, timeout=self.timeout).content
-        except requests.ConnectionError as err:
-            msg = f'Could not connect to {endpoint}. {str(err)}'
-            raise ex.ServerConnectionError(msg) from None  # disable chaining
-
-        self.apiversion = float(verstr)
-
-        expected_api = CsdcClient.KNOWN_GOOD_API_VERSION
-        if (int(self.apiversion) - int(expected_api)) >= 1:
-            msg = (f'The Astro Archive Client you are running expects an older '
-                   f'version of the API services. '
-                   f'Please upgrade to the latest "astroget".  '
-                   f'The Client you are using expected version '
-                   f'{CsdcClient.KNOWN_GOOD_API_VERSION} but got '
-                   f'{self.apiversion} from the Astro Archive Server '
-                   f'at {self.apiurl}.')
-            raise Exception(msg)
         self.clientversion = client_version
         #@@@  diff for each instrument,proctype !!!
         # aux+hdu
         self.fields = list()
 
-        funcToMethod(experimental.hdu_bounds, CsdcClient)
-        funcToMethod(experimental.fitscheck, CsdcClient)
-
         ###
         ####################################################
         # END __init__()
 
+    # Experimental methods are attached to the class on first use so
+    # that importing astroget.experimental is not paid on every client.
+    _experimental_methods = ('hdu_bounds', 'fitscheck')
+
+    def __getattr__(self, name):
+        if name in CsdcClient._experimental_methods:
+            import astroget.experimental as experimental
+            func = getattr(experimental, name)
+            funcToMethod(func, CsdcClient)
+            return func.__get__(self, type(self))
+        raise AttributeError(f'{type(self).__name__!r} object has no '
+                             f'attribute {name!r}')
+
     def __repr__(self):
         return(f'(astroget:{self.clientversion},'
                f' api:{self.apiversion},'
@@ -225,6 +527,29 @@ class CsdcClient():
                f' connect_timeout={self.c_timeout},'
                f' read_timeout={self.r_timeout})')
 
+    def close(self):
+        """Release the pooled connections held by this client.
+        A session passed to the constructor is left open."""
+        if self._own_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _dyn_timeout(self, payload_bytes, limit):
+        """(connect, read) timeout for a request whose POST payload is
+        PAYLOAD_BYTES long and that returns up to LIMIT records.
+        Big queries get more time than the read_timeout given to the
+        constructor (up to MAX_READ_TIMEOUT); never less."""
+        if limit is None:  # size unknown; use the constructor's timeout
+            return self.timeout
+        read = payload_bytes / 50_000 + limit / 100
+        return (self.c_timeout,
+                min(MAX_READ_TIMEOUT, max(self.r_timeout, read)))
+
     def _validate_fields(self, fields):
         """Raise exception if any field name in FIELDS is
         not registered."""
@@ -244,12 +569,36 @@ class CsdcClient():
             >>> client.expected_server_version
             6.0
         """
+        return self._check_api_version()
 
+    def _check_api_version(self):
+        """Get the API version of the Server (once per URL) and raise
+        if this Client is too old for it. Returns the API version."""
+        if self.apiversion is None:
+            self.apiversion = CsdcClient._api_version_cache.get(self.apiurl)
         if self.apiversion is None:
-            response = requests.get(f'{self.apiurl}/version',
-                                    timeout=self.timeout,
-                                    cache=True)
-            self.apiversion = float(response.content)
+            try:
+                endpoint = self._u_version
+                with self.session.get(endpoint, timeout=self.timeout) as res:
+                    res.raise_for_status()
+                    # float() takes bytes; body is short (e.g. b"8.0\n")
+                    apiversion = float(res.content[:16])
+            except requests.ConnectionError as err:
+                msg = f'Could not connect to {endpoint}. {str(err)}'
+                raise ex.ServerConnectionError(msg) from None  # no chaining
+
+            expected_api = CsdcClient.KNOWN_GOOD_API_VERSION
+            if (int(apiversion) - int(expected_api)) >= 1:
+                msg = (f'The Astro Archive Client you are running expects an '
+                       f'older version of the API services. '
+                       f'Please upgrade to the latest "astroget".  '
+                       f'The Client you are using expected version '
+                       f'{CsdcClient.KNOWN_GOOD_API_VERSION} but got '
+                       f'{apiversion} from the Astro Archive Server '
+                       f'at {self.apiurl}.')
+                raise Exception(msg)
+            CsdcClient._api_version_cache[self.apiurl] = apiversion
+            self.apiversion = apiversion
         return self.apiversion
 
     def find(self, outfields=None, *,
@@ -300,31 +649,44 @@ class CsdcClient():
 
         """
         verbose = self.verbose if verbose is None else verbose
+        self._check_api_version()
         # Let "outfields" default to ['id']; but fld may have been renamed
         if outfields is None:
             outfields = ['md5sum'] # id
         if len(constraints) > 0:
             self._validate_fields(constraints.keys())
-        used = set(outfields + list(constraints.keys()))
-        rectype='hdu' if any([s.startswith('hdu:') for s in used]) else 'file'
+        used = (*outfields, *constraints)
+        rectype='hdu' if any(s.startswith('hdu:') for s in used) else 'file'
 
-        uparams = dict(limit=limit, rectype=rectype)
+        qstr = f'limit={limit}&rectype={rectype}'
         if sort is not None:
-            uparams['sort'] = sort
-        qstr = urlencode(uparams)
-        url = f'{self.apiurl}/adv_search/find/?{qstr}'
+            qstr += '&' + urlencode(dict(sort=sort))
+        url = f'{self._u_find}{qstr}'
         if verbose:
             print(f'ads/find url={url}')
 
         search = [[k] + v for k, v in constraints.items()]
         sspec = dict(outfields=outfields, search=search)
-        res = requests.post(url, json=sspec, timeout=self.timeout)
+        payload = json.dumps(sspec)
+        timeout = self._dyn_timeout(len(payload), limit)
+        try:
+            res = self.session.post(url, data=payload,
+                                    headers={'Content-Type':
+                                             'application/json'},
+                                    timeout=timeout)
+        except requests.ReadTimeout:
+            msg = (f'No response from {self.apiurl} within {timeout[1]}'
+                   f' seconds. Try a smaller limit or a larger'
+                   f' read_timeout.')
+            raise ex.ReadTimeout(msg) from None  # no chaining
         if res.status_code != 200:
-            if verbose and ('traceback' in res.json()):
-                print(f'DBG: Server traceback=\n{res.json()["traceback"]}')
-            raise ex.genAstrogetException(res, verbose=self.verbose)
+            status = _error_status(res)
+            if verbose and status and ('traceback' in status):
+                print(f'DBG: Server traceback=\n{status["traceback"]}')
+            raise ex.genAstrogetException(res, status=status,
+                                          verbose=self.verbose)
 
-        return Found(res.json(), client=self)
+        return Found(_json_loads(res.content), client=self)
         # END find()
 
     # /api/sia/vohdu?POS=194.1820667,21.6826583&SIZE=0.4
@@ -341,32 +703,30 @@ class CsdcClient():
               limit=None):
         """NEED DOCSTRING for 'client.py:vohdu()' !!!"""
         verbose = self.verbose if verbose is None else verbose
+        self._check_api_version()
+        # "limit" is always sent (even when None) to keep the server default
         uparams = dict(limit=limit,
                        format='json',
-                       POS=','.join([str(c) for c in pos]),
+                       POS=f'{pos[0]},{pos[1]}',
                        SIZE=size)
-        if instrument is not None:
-            uparams['instrument'] = instrument
-        if obs_type is not None:
-            uparams['obs_type'] = obs_type
-        if proc_type is not None:
-            uparams['proc_type'] = proc_type
-        if VERB is not None:
-            uparams['VERB'] = VERB
-        if FORMAT is not None:
-            uparams['FORMAT'] = FORMAT
+        uparams.update({k: v for k, v in (('instrument', instrument),
+                                          ('obs_type', obs_type),
+                                          ('proc_type', proc_type),
+                                          ('VERB', VERB),
+                                          ('FORMAT', FORMAT))
+                        if v is not None})
         qstr = urlencode(uparams)
-        url = f'{self.apiurl}/sia/vohdu?{qstr}'
+        url = f'{self._u_vohdu}{qstr}'
         if verbose:
             print(f'url={url}')
-        res = requests.get(url, timeout=self.timeout)
+        res = self.session.get(url, timeout=self.timeout)
 
         if res.status_code != 200:
             if verbose:
                 print(f'DBG: Web-service error={res.content}')
             raise Exception(f'res={res} verbose={self.verbose}')
 
-        found = Found(res.json(), client=self)
+        found = Found(_json_loads(res.content), client=self)
         for rec in found.records:
             #!print(f'rec={rec}')
             if 'url' in rec:
@@ -382,70 +742,176 @@ class CsdcClient():
         """Download one FITS file from the Astro Data Archive.
 NEED DOCSTRING for 'client.py:getimage()' !!!"""
         verbose = self.verbose if verbose is None else verbose
-        uparams = dict(limit=limit,
-                       format='json',
-                       )
-        qstr = urlencode(uparams)
-        url = f'{self.apiurl}/retrieve/{file_id}?{qstr}'
+        self._check_api_version()
+        url = f'{self._u_retrieve}{file_id}'
+        if hdus is not None:
+            url += '?' + urlencode(dict(hdus=','.join(map(str, hdus))))
         if verbose:
             print(f'url={url}')
-        res = requests.get(url, timeout=self.timeout)
+        with self.session.get(url, timeout=self.timeout, stream=True) as res:
+            if res.status_code != 200:
+                if verbose:
+                    print(f'DBG: Web-service error={res.content}')
+                raise Exception(f'res={res} verbose={verbose}')
 
-        if res.status_code != 200:
-            if verbose:
-                print(f'DBG: Web-service error={res.content}')
-            raise Exception(f'res={res} verbose={verbose}')
-
-        if outfile is None:
-            hdustr = 'x' if hdus is None else '_'.join(hdus)
-            outfile = f'ADA_{md5}_{hudstr}.fits' # Astro Data Archive
-        with open(outfile, 'wb') as fd:
-            for chunk in res.iter_content(chunk_size=128):
-                fd.write(chunk)
+            if outfile is None:
+                hdustr = 'x' if hdus is None else '_'.join(map(str, hdus))
+                outfile = f'ADA_{file_id}_{hdustr}.fits' # Astro Data Archive
+            _save_response(res, outfile)
         return outfile
 
+    def getimages(self, file_ids, concurrency=16, verbose=None):
+        """Download many FITS files from the Astro Data Archive concurrently.
+        Uses a single HTTP/2 connection pool (requires "httpx[http2]").
+        Each file is written to ADA_<file_id>_x.fits (same as getimage()).
+        May be called from a notebook (where an event loop is already
+        running); in async code, await agetimages() instead.
+
+        Args:
+            file_ids (:obj:`list`): File ids (md5sum) of images to download.
+
+            concurrency (:obj:`int`, optional): Maximum number of
+                downloads in progress at once. Defaults to 16.
+
+        Returns:
+            List of output filenames (:obj:`list`), in order of FILE_IDS.
+        """
+        import asyncio
+
+        coro = self.agetimages(file_ids, concurrency=concurrency,
+                               verbose=verbose)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:  # no running loop (plain script)
+            return asyncio.run(coro)
+        # e.g. Jupyter: asyncio.run() cannot be nested; use another thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    async def agetimages(self, file_ids, concurrency=16, verbose=None):
+        """Async version of getimages()."""
+        import asyncio
+        import httpx
+
+        verbose = self.verbose if verbose is None else verbose
+        self._check_api_version()
+
+        async def _aget(client, sem, file_id):
+            url = f'{self._u_retrieve}{file_id}'
+            outfile = f'ADA_{file_id}_x.fits' # Astro Data Archive
+            partfile = f'{outfile}.part'  # renamed when download completes
+            if verbose:
+                print(f'url={url}')
+            async with sem:
+                async with client.stream('GET', url) as res:
+                    if res.status_code != 200:
+                        await res.aread()
+                        if verbose:
+                            print(f'DBG: Web-service error={res.content}')
+                        raise Exception(f'res={res} verbose={verbose}')
+                    try:
+                        with open(partfile, 'wb') as fd:
+                            async for chunk in res.aiter_bytes(
+                                    DOWNLOAD_CHUNK_SIZE):
+                                fd.write(chunk)
+                    except BaseException:  # includes cancellation
+                        with contextlib.suppress(FileNotFoundError):
+                            os.remove(partfile)  # open() may have failed
+                        raise
+            os.replace(partfile, outfile)
+            return outfile
+
+        sem = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=concurrency)
+        timeout = httpx.Timeout(self.r_timeout, connect=self.c_timeout)
+        # Same User-Agent and Accept-Encoding as getimage()
+        async with httpx.AsyncClient(http2=True,
+                                     headers=self.session.headers,
+                                     timeout=timeout,
+                                     limits=limits) as client:
+            return list(await asyncio.gather(*[_aget(client, sem, fid)
+                                               for fid in file_ids]))
+
 
     # curl -X GET "http://localhost:8010/api/cutout/b61e72a2151eb69b73248e8e146ef596?hduidx=35&ra=194.1820667&dec=21.6826583&size=40" > ~/subimage.fits
     # Get FITS containing subimage from one HDU
     def cutout(self, ra, dec, size, md5, hduidx,
                outfile=None, verbose=None):
         verbose = self.verbose if verbose is None else verbose
+        self._check_api_version()
         # validate_params() @@@ !!!
         #! uparams = dict(ra=ra, dec=dec, size=size, hduidx=hduidx)
         # Following is hack/workaround for NAT-701
         uparams = dict(ra=ra, dec=dec, size=size, hduidx=hduidx+1)
         qstr = urlencode(uparams)
-        url = f'{self.apiurl}/cutout/{md5}?{qstr}'
+        url = f'{self._u_cutout}{md5}?{qstr}'
         if verbose:
             print(f'cutout url={url}')
-        res = requests.get(url, timeout=self.timeout)
-
-        if res.status_code != 200:
-            if verbose:
-                print(f'DBG: client.cutout({(ra,dec,size,md5,hduidx)});'
-                      f'  Web-service error={res.json()}')
-            raise Exception(f'res={res} verbose={verbose}; {res.json()}')
-        #return res
-        if outfile is None:
-            outfile = f'subimage_{md5}_{int(ra)}_{int(dec)}.fits'
-        with open(outfile, 'wb') as fd:
-            for chunk in res.iter_content(chunk_size=128):
-                fd.write(chunk)
+        with self.session.get(url, timeout=self.timeout, stream=True) as res:
+            if res.status_code != 200:
+                status = _error_status(res)
+                if verbose:
+                    print(f'DBG: client.cutout({(ra,dec,size,md5,hduidx)});'
+                          f'  Web-service error={status}')
+                raise Exception(f'res={res} verbose={verbose}; {status}')
+            #return res
+            if outfile is None:
+                outfile = f'subimage_{md5}_{int(ra)}_{int(dec)}.fits'
+            _save_response(res, outfile)
         return outfile
 
     def fits_header(self, md5, verbose=None):
         """Return FITS header as list of dictionaries.
         (One dictionary per HDU.)"""
         verbose = self.verbose if verbose is None else verbose
+        self._check_api_version()
         # validate_params() @@@ !!!
-        uparams = dict(format='json')
-        qstr = urlencode(uparams)
-        url = f'{self.apiurl}/header/{md5}?{qstr}'
+        url = f'{self._u_header}{md5}?format=json'
         if verbose:
             print(f'api/header url={url}')
-        res = requests.get(url, timeout=self.timeout)
-        self.headers[md5] = res.json()
-        return res.json()
+        res = self.session.get(url, timeout=self.timeout)
+        self.headers[md5] = _json_loads(res.content)
+        return self.headers[md5]
+
+    def fits_headers(self, md5s, concurrency=16, verbose=None):
+        """Return FITS headers for many files.
+        Asks the server for all of them in one request. If the server
+        does not support that, get them concurrently one file at a time.
+
+        Args:
+            md5s (:obj:`list`): File ids (md5sum) of FITS files.
+
+            concurrency (:obj:`int`, optional): Maximum number of
+                concurrent requests when falling back to one request
+                per file. Defaults to 16.
+
+        Returns:
+            Dictionary (:obj:`dict`) keyed by md5. Each value is a list of
+            dictionaries (one per HDU) as returned by fits_header().
+        """
+        verbose = self.verbose if verbose is None else verbose
+        self._check_api_version()
+        md5s = list(md5s)
+        if self.apiurl not in CsdcClient._no_headers_batch:
+            url = self._u_headers
+            if verbose:
+                print(f'api/headers url={url}')
+            res = self.session.post(url, json=dict(md5s=md5s),
+                                    timeout=self.timeout)
+            if res.status_code == 200:
+                hdrs = _json_loads(res.content)
+                self.headers.update(hdrs)
+                return hdrs
+            if res.status_code not in (404, 405, 501):
+                raise ex.genAstrogetException(res, status=_error_status(res),
+                                              verbose=verbose)
+            CsdcClient._no_headers_batch.add(self.apiurl)
+
+        # Server has no batch endpoint; fan out over the session pool.
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            hdrlist = list(executor.map(
+                lambda md5: self.fits_header(md5, verbose=verbose), md5s))
+        return dict(zip(md5s, hdrlist))
 
 
 ###
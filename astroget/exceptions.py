@@ -1,30 +1,28 @@
+import sys
 import traceback
 
+from astroget._json import loads as _json_loads
 
-def genAstrogetException(response, verbose=False):
+
+def genAstrogetException(response, status=None, verbose=False):
     """Given status from Server response.json(), which is a dict, generate
-    a native exception suitable for Science programs."""
+    a native exception suitable for Science programs.
+    Pass STATUS if the caller already decoded response.json()."""
 
-    content = response.content
     if verbose:
-        print(f'Exception: response content={content}')
-    status = response.json()
-
-    # As of Python 3.10.0.alpha6, python "match" statement could be used
-    # instead of if-elif-else.
-    # https://docs.python.org/3.10/whatsnew/3.10.html#pep-634-structural-pattern-matching
-    if status.get('errorCode') == 'BADPATH':
-        return BadPath(status.get('errorMessage'))
-    elif status.get('errorCode') == 'BADQUERY':
-        return BadQuery(status.get('errorMessage'))
-    elif status.get('errorCode') == 'UNKFIELD':
-        return UnknownField(status.get('errorMessage'))
-    elif status.get('errorCode') == 'BADCONST':
-        return BadSearchConstraint(status.get('errorMessage'))
-    else:
-        return UnknownServerError(
-            f"{status.get('errorMessage')} "
-            f"[{status.get('errorCode')}]")
+        print(f'Exception: response content={response.content}')
+    if status is None:
+        try:
+            status = _json_loads(response.content)
+        except ValueError:  # not JSON; e.g. HTML error page from a proxy
+            return UnknownServerError(f'HTTP {response.status_code}')
+    code = status.get('errorCode')
+    msg = status.get('errorMessage')
+
+    cls = _ERROR_TABLE.get(code)
+    if cls is None:
+        return UnknownServerError(f"{msg} [{code}]")
+    return cls(msg)
 
 
 class BaseClientException(Exception):
@@ -41,17 +39,22 @@ class BaseClientException(Exception):
         self.error_message = error_message
         if error_code:
             self.error_code = error_code
-        self.traceback = traceback.format_exc()
+        # Traceback of the exception being handled (if any) when this one
+        # was created. Keep only the text; holding the traceback object
+        # would keep its frames (and their locals) alive.
+        if sys.exc_info()[0] is not None:
+            self.traceback = traceback.format_exc()
 
     def __str__(self):
         return f'[{self.error_code}] {self.error_message}'
 
     def to_dict(self):
         """Convert a SPARCL exception to a python dictionary"""
-        dd = dict(errorMessage=self.error_message,
-                  errorCode=self.error_code)
-        if self.traceback is not None:
-            dd['traceback'] = self.traceback
+        dd = {'errorMessage': self.error_message,
+              'errorCode': self.error_code}
+        tb = self.traceback
+        if tb is not None:
+            dd['traceback'] = tb
         return dd
 
 
@@ -111,3 +114,12 @@ class BadSearchConstraint(BaseClientException):
 
 
 # error_code values should be no bigger than 8 characters 12345678
+
+
+# errorCode (from Server) -> Exception class used by genAstrogetException()
+_ERROR_TABLE = {
+    'BADPATH': BadPath,
+    'BADQUERY': BadQuery,
+    'UNKFIELD': UnknownField,
+    'BADCONST': BadSearchConstraint,
+}
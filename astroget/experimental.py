@@ -18,7 +18,7 @@ def hdu_bounds(self, md5, hduidx, vet=0, verbose=True):
     url = f'{self.apiurl}/header/{md5}?{qstr}'
     if verbose:
         print(f'api/header url={url}')
-    res = requests.get(url, timeout=self.timeout)
+    res = self.session.get(url, timeout=self.timeout)
     self.headers[md5] = res.json()
 
     #!header = res.json()[hduidx]
@@ -78,13 +78,14 @@ def hdu_bounds(self, md5, hduidx, vet=0, verbose=True):
 def fitscheck(self, file_id, verbose=False):
     """Verify FITS file"""
     verbose = self.verbose if verbose is None else verbose
+    self._check_api_version()
     uparams = dict(format='json',
                    )
     qstr = urlencode(uparams)
     url = f'{self.apiurl}/check/{file_id}?{qstr}'
     if verbose:
         print(f'url={url}')
-    res = requests.get(url, timeout=self.timeout)
+    res = self.session.get(url, timeout=self.timeout)
 
     if res.status_code != 200:
         if verbose:
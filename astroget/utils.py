@@ -3,6 +3,8 @@
 import datetime
 import time
 import socket
+import warnings
+from contextlib import contextmanager
 # External packages
 #   none
 # LOCAL packages
@@ -29,47 +31,75 @@ class _AttrDict(dict):
     (as well as normally).
     """
     def __init__(self, *args, **kwargs):
-        def from_nested_dict(data):
-            """ Construct nested AttrDicts from nested dictionaries. """
-            if not isinstance(data, dict):
-                return data
-            else:
-                return _AttrDict({key: from_nested_dict(data[key])
-                                 for key in data})
-
-        super(_AttrDict, self).__init__(*args, **kwargs)
+        if len(args) == 1 and not kwargs and isinstance(args[0], dict):
+            data = args[0]
+        else:
+            data = dict(*args, **kwargs)
+        # Build each level (and each nested AttrDict) exactly once.
+        # "type() is dict" is a cheap test for the common scalar values
+        # and leaves values that already are _AttrDict alone.
+        super(_AttrDict, self).__init__(
+            (key, _AttrDict(val) if type(val) is dict else val)
+            for key, val in data.items())
         self.__dict__ = self
 
-        for key in self.keys():
-            self[key] = from_nested_dict(self[key])
+
+@contextmanager
+def timed():
+    """Track elapsed time of a block. Reentrant and thread-safe
+    (no shared state), unlike tic()/toc().
+
+    Yields:
+       Function returning elapsed seconds (float) since start of block.
+       After the block exits it returns the duration of the block.
+
+    Example:
+       >>> with timed() as elapsed:
+       ...     time.sleep(0.1)
+       >>> round(elapsed(), 1)
+       0.1
+    """
+    start_ns = time.perf_counter_ns()
+    end_ns = None
+
+    def elapsed():
+        return ((end_ns or time.perf_counter_ns()) - start_ns) * 1e-9
+
+    try:
+        yield elapsed
+    finally:
+        end_ns = time.perf_counter_ns()
 
 
 def tic():
     """Start tracking elapsed time. Works in conjunction with toc().
+    DEPRECATED: use timed() instead.
 
     Args:
        None.
     Returns:
        Elapsed time.
     """
-    tic.start = time.perf_counter()
+    warnings.warn('tic()/toc() are deprecated; use timed()',
+                  DeprecationWarning, stacklevel=2)
+    tic.start = time.perf_counter_ns()
 
 
 def toc():
     """Return elapsed time since previous tic().
+    DEPRECATED: use timed() instead.
 
     Args:
        None.
     Returns:
        Elapsed time since previous tic().
     """
-    elapsed_seconds = time.perf_counter() - tic.start
+    elapsed_seconds = (time.perf_counter_ns() - tic.start) * 1e-9
     return elapsed_seconds  # fractional
 
 def EXAMPLE_tic_toc():
-    tic()
-    print('do a bunch of stuff')
-    time.sleep(1)
-    elapsed = toc()
-    print(f'Elapsed time between tic() and toc() = {elapsed:2.1f} seconds')
-    return elapsed
+    with timed() as elapsed:
+        print('do a bunch of stuff')
+        time.sleep(1)
+    print(f'Elapsed time of block = {elapsed():2.1f} seconds')
+    return elapsed()
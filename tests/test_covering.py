@@ -0,0 +1,46 @@
+"""Unit tests of astroget.client.hdus_covering() (no server needed)."""
+
+import unittest
+
+import numpy as np
+
+import astroget.client as ac
+
+
+def _corners(centers, half=0.1):
+    """corners_array() layout for square HDUs around CENTERS."""
+    corners = np.empty((len(centers), 5, 2))
+    corners[:, 0] = centers
+    for j, (dra, ddec) in enumerate([(-1, -1), (1, -1), (1, 1), (-1, 1)]):
+        corners[:, j + 1, 0] = centers[:, 0] + dra * half
+        corners[:, j + 1, 1] = centers[:, 1] + ddec * half
+    return corners
+
+
+class HdusCoveringTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(1)
+        centers = rng.uniform([0, -60], [360, 60], (60, 2))
+        cls.corners = _corners(centers)
+        cls.corners[3, 2] = np.nan  # HDU with a missing corner
+        cls.query = np.concatenate([centers + 0.01,
+                                    rng.uniform([0, -60], [360, 60],
+                                                (500, 2))])
+
+    def test_numpy(self):
+        actual = ac._hdus_covering_np(self.query, self.corners)
+        self.assertEqual(list(actual[:6]), [0, 1, 2, -1, 4, 5])
+
+    def test_numba_matches_numpy(self):
+        kernel = ac._hdus_covering_nb()
+        if kernel is None:
+            self.skipTest('numba is not installed')
+        np.testing.assert_array_equal(
+            kernel(self.query, self.corners),
+            ac._hdus_covering_np(self.query, self.corners))
+
+    def test_no_hdus(self):
+        actual = ac.hdus_covering(self.query[:3], ac.corners_array([]))
+        self.assertEqual(list(actual), [-1, -1, -1])
@@ -0,0 +1,113 @@
+"""Unit tests of astroget.client.hdu_keywords() on small generated
+FITS files (no server needed)."""
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+import numpy as np
+from astropy.io import fits
+from astropy.utils.exceptions import AstropyUserWarning
+
+import astroget.client as ac
+
+
+def _mef():
+    """HDUList with one HDU of each kind; MARK is the HDU index."""
+    hdul = fits.HDUList([
+        fits.PrimaryHDU(),
+        fits.ImageHDU(np.arange(35, dtype='>i2').reshape(5, 7)),
+        fits.BinTableHDU.from_columns([  # variable length array: heap
+            fits.Column(name='va', format='PJ()',
+                        array=np.array([[1, 2, 3], [4], [5, 6]],
+                                       dtype=object)),
+            fits.Column(name='x', format='D', array=[1., 2., 3.])]),
+        fits.CompImageHDU(np.arange(400, dtype='>f4').reshape(20, 20)),
+        fits.ImageHDU(np.ones((3, 4, 5), dtype='>f8')),
+    ])
+    for idx, hdu in enumerate(hdul):
+        hdu.header['MARK'] = idx
+    return hdul
+
+
+class HduKeywordsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.mef = os.path.join(cls.tmpdir, 'mef.fits')
+        _mef().writeto(cls.mef)
+        cls.nhdus = len(_mef())
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def _copy(self, name, nbytes=None, extra=b''):
+        """Copy of the MEF (first NBYTES of it) followed by EXTRA."""
+        path = os.path.join(self.tmpdir, name)
+        with open(self.mef, 'rb') as fin:
+            content = fin.read(nbytes)
+        opener = gzip.open if name.endswith('.gz') else open
+        with opener(path, 'wb') as fout:
+            fout.write(content + extra)
+        return path
+
+    def _marks(self, path):
+        return [d.get('MARK') for d in ac.hdu_keywords(path, keys=['MARK'])]
+
+    def test_every_hdu_kind(self):
+        self.assertEqual(self._marks(self.mef), list(range(self.nhdus)))
+
+    def test_matches_fits_open(self):
+        keys = ['XTENSION', 'NAXIS1', 'NAXIS2', 'PCOUNT', 'MARK']
+        with fits.open(self.mef, disable_image_compression=True) as hdul:
+            expected = [{k: hdu.header[k] for k in keys if k in hdu.header}
+                        for hdu in hdul]
+        self.assertEqual(ac.hdu_keywords(self.mef, keys=keys), expected)
+
+    def test_data_size(self):
+        with fits.open(self.mef, disable_image_compression=True) as hdul:
+            for idx, hdu in enumerate(hdul):
+                self.assertEqual(ac._hdu_data_size(hdu.header),
+                                 hdul.fileinfo(idx)['datSpan'])
+
+    def test_random_groups(self):
+        hdr = fits.Header([('SIMPLE', True), ('BITPIX', -32),
+                           ('NAXIS', 3), ('NAXIS1', 0), ('NAXIS2', 4),
+                           ('NAXIS3', 5), ('GROUPS', True),
+                           ('PCOUNT', 2), ('GCOUNT', 10)])
+        self.assertEqual(ac._hdu_data_size(hdr), 2880)  # 4*10*(2+20)=880
+
+    def test_gzip_and_path(self):
+        path = Path(self._copy('mef.fits.gz'))
+        self.assertEqual(self._marks(path), list(range(self.nhdus)))
+
+    def test_truncated_data(self):
+        path = self._copy('trunc.fits', os.path.getsize(self.mef) - 100)
+        with self.assertRaises(OSError):
+            ac.hdu_keywords(path)
+
+    def test_truncated_header(self):
+        path = self._copy('trunc_hdr.fits', 2880 + 1000)
+        with self.assertRaises(OSError):
+            ac.hdu_keywords(path)
+
+    def test_zero_padding(self):
+        path = self._copy('padded.fits', extra=b'\0' * 2880)
+        with self.assertWarns(AstropyUserWarning):
+            marks = self._marks(path)
+        self.assertEqual(marks, list(range(self.nhdus)))
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', AstropyUserWarning)
+            with fits.open(path) as hdul:
+                self.assertEqual(len(hdul), self.nhdus)
+
+    def test_garbage_after_padding(self):
+        path = self._copy('garbage.fits', extra=b'\0' * 2880 + b'junk')
+        with self.assertRaises(OSError):
+            ac.hdu_keywords(path)